@@ -1,5 +1,6 @@
 import streamlit as st
 from src.search import Search
+from src.singleflight import SearchBusyError
 
 st.set_page_config(page_title="Reddit GenAI Search Engine", layout="wide")
 st.title("🔎 Reddit GenAI Search Engine")
@@ -14,9 +15,16 @@ search_engine = load_search_engine()
 query = st.text_input("Enter your search query:")
 if query:
     with st.spinner("Searching..."):
-        results = search_engine.search(query)
+        try:
+            results = search_engine.search(query)
+        except SearchBusyError as e:
+            st.warning(f"The search engine is busy: {e}")
+            st.stop()
         st.subheader("Answer from LLM:")
         think = results.split("</think>")[0].replace("<think>", "").strip()
         answer = results.split("</think>")[-1].strip()
         st.write(answer)
         st.expander("LLM's Thought Process", expanded=False).write(think)
+
+with st.sidebar.expander("Search load", expanded=False):
+    st.json(search_engine.stats())
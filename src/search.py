@@ -1,16 +1,31 @@
 from .rerank import Reranker
 from .retrieve import Retriever
 from .generate import Generate
+from .singleflight import SingleFlight
 
 class Search:
-    def __init__(self, index_name="reddit-genai", top_k_retrieve=20, top_k_rerank=5):
+    def __init__(self, index_name="reddit-genai", top_k_retrieve=20, top_k_rerank=5, max_in_flight=2, max_queued=16):
         self.retriever = Retriever(index_name=index_name)
         self.reranker = Reranker()
         self.generator = Generate(25)
         self.top_k_retrieve = top_k_retrieve
         self.top_k_rerank = top_k_rerank
+        self.flight = SingleFlight(max_in_flight=max_in_flight, max_queued=max_queued)
+
+    @staticmethod
+    def normalize_query(query):
+        return " ".join(query.lower().split())
 
     def search(self, query):
+        """
+        Runs the pipeline for a query, sharing the result with concurrent identical queries
+        """
+        return self.flight.do(self.normalize_query(query), self._search, query)
+
+    def stats(self):
+        return self.flight.stats()
+
+    def _search(self, query):
         # Step 1: Retrieve relevant documents
         retrieved_docs = self.retriever.search(query, top_k=self.top_k_retrieve)
 
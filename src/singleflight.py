@@ -0,0 +1,93 @@
+import threading
+
+
+class SearchBusyError(RuntimeError):
+    """Raised when too many distinct queries are already running or queued."""
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one computation.
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive while it is in flight wait for it and get the same result or error.
+    At most `max_in_flight` distinct keys run at once, and at most
+    `max_queued` more may wait for a slot before new keys are rejected.
+    """
+
+    def __init__(self, max_in_flight=2, max_queued=16):
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._calls = {}
+        self._running = 0
+        self._queued = 0
+        self._waiting = 0
+        self._executed = 0
+        self._coalesced = 0
+        self._rejected = 0
+
+    def do(self, key, fn, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._coalesced += 1
+                self._waiting += 1
+                leader = False
+            elif len(self._calls) >= self.max_in_flight + self.max_queued:
+                self._rejected += 1
+                raise SearchBusyError(
+                    f"{len(self._calls)} queries already in flight or queued, try again shortly"
+                )
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._queued += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            with self._lock:
+                self._waiting -= 1
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        self._slots.acquire()
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._slots.release()
+            with self._lock:
+                self._running -= 1
+                self._executed += 1
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "running": self._running,
+                "queued": self._queued,
+                "waiting": self._waiting,
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "rejected": self._rejected,
+                "max_in_flight": self.max_in_flight,
+                "max_queued": self.max_queued,
+            }